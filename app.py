@@ -16,7 +16,7 @@ from functools import wraps
 from mailersend_email import init_email_config
 from scheduler_setup import init_scheduler
 from models import create_user, get_user_by_email, get_user, get_financial_health, get_budgets, get_bills, get_net_worth, get_emergency_funds, get_learning_progress, get_quiz_results, to_dict_financial_health, to_dict_budget, to_dict_bill, to_dict_net_worth, to_dict_emergency_fund, to_dict_learning_progress, to_dict_quiz_result, initialize_database
-from utils import trans_function, is_valid_email, get_mongo_db, close_mongo_db, get_limiter, get_mail, requires_role, check_coin_balance
+from utils import trans_function, is_valid_email, get_mongo_db, close_mongo_db, get_limiter, get_mail, requires_role, check_coin_balance, queue_insert, flush_insert_queue
 from session_utils import create_anonymous_session
 
 # Import the new translation system
@@ -87,12 +87,109 @@ def ensure_session_id(f):
                 else:
                     session['sid'] = session.sid
                     session['is_anonymous'] = False
-                    logger.info(f"New session ID generated for authenticated user: {session['sid']}")
+                    logger.info("New session ID generated for authenticated user: %s", session['sid'])
         except Exception as e:
-            logger.error(f"Session operation failed: {str(e)}")
+            logger.error("Session operation failed: %s", e)
         return f(*args, **kwargs)
     return decorated_function
 
+# Paths served without session bootstrap (static assets and health probes)
+SESSIONLESS_PATHS = frozenset([
+    '/manifest.json', '/service-worker.js', '/favicon.ico', '/robots.txt', '/health'
+])
+
+# Landing endpoint for authenticated users by role; other roles get the general home page
+ROLE_HOME_ENDPOINTS = {
+    'agent': 'agents_bp.dashboard',
+    'trader': 'dashboard_bp.index',
+    'admin': 'admin_bp.dashboard',
+    'personal': 'general_dashboard'
+}
+
+# Web app manifest served at /manifest.json (static, shared across requests)
+MANIFEST = {
+    'name': 'FiCore',
+    'short_name': 'FiCore',
+    'description': 'Manage your finances with ease',
+    'theme_color': '#007bff',
+    'background_color': '#ffffff',
+    'display': 'standalone',
+    'scope': '/',
+    'start_url': '/',
+    'icons': [
+        {'src': '/static/icons/icon-192x192.png', 'sizes': '192x192', 'type': 'image/png'},
+        {'src': '/static/icons/icon-512x512.png', 'sizes': '512x512', 'type': 'image/png'}
+    ]
+}
+
+# Placeholder data for general_dashboard sections without records (read-only, shared across requests)
+DASHBOARD_DEFAULTS = {
+    'financial_health': {'score': None, 'status': None},
+    'budget': {'surplus_deficit': None, 'savings_goal': None},
+    'bills': {'bills': [], 'total_amount': 0, 'unpaid_amount': 0},
+    'net_worth': {'net_worth': None, 'total_assets': None},
+    'emergency_fund': {'target_amount': None, 'savings_gap': None},
+    'learning_progress': {},
+    'quiz': {'personality': None, 'score': None}
+}
+
+# Feedback tool choices as (value, translation key); labels are cached per language
+FEEDBACK_TOOLS = [
+    ('profile', 'general_profile'),
+    ('coins', 'coins_dashboard'),
+    ('debtors', 'debtors_dashboard'),
+    ('creditors', 'creditors_dashboard'),
+    ('receipts', 'receipts_dashboard'),
+    ('payment', 'payments_dashboard'),
+    ('inventory', 'inventory_dashboard'),
+    ('report', 'reports_dashboard'),
+    ('financial_health', 'financial_health_calculator'),
+    ('budget', 'budget_budget_planner'),
+    ('bill', 'bill_bill_planner'),
+    ('net_worth', 'net_worth_calculator'),
+    ('emergency_fund', 'emergency_fund_calculator'),
+    ('learning', 'learning_hub_courses'),
+    ('quiz', 'quiz_personality_quiz')
+]
+FEEDBACK_TOOL_VALUES = frozenset(value for value, key in FEEDBACK_TOOLS)
+FEEDBACK_RATINGS = frozenset(['1', '2', '3', '4', '5'])
+_FEEDBACK_TOOL_OPTIONS_CACHE = {}
+
+def get_feedback_tool_options(lang):
+    """Return the translated feedback tool choices for a language, building them once."""
+    tool_options = _FEEDBACK_TOOL_OPTIONS_CACHE.get(lang)
+    if tool_options is None:
+        tool_options = [[value, trans(key, lang=lang)] for value, key in FEEDBACK_TOOLS]
+        _FEEDBACK_TOOL_OPTIONS_CACHE[lang] = tool_options
+    return tool_options
+
+_AVAILABLE_LANGUAGES_BY_LANG = {}
+
+def get_available_languages(lang):
+    """Return the language switcher entries labelled in the given language, built once per language."""
+    languages = _AVAILABLE_LANGUAGES_BY_LANG.get(lang)
+    if languages is None:
+        languages = [
+            {'code': 'en', 'name': trans('general_english', lang=lang)},
+            {'code': 'ha', 'name': trans('general_hausa', lang=lang)}
+        ]
+        _AVAILABLE_LANGUAGES_BY_LANG[lang] = languages
+    return languages
+
+_FLAT_TRANSLATIONS_CACHE = {}
+
+def get_flat_translations(lang):
+    """Return all module translations for a language merged into one dict, built once per language."""
+    result = _FLAT_TRANSLATIONS_CACHE.get(lang)
+    if result is None:
+        result = {}
+        # Flatten all translations for the requested language
+        for module_name, module_translations in get_all_translations().items():
+            if lang in module_translations:
+                result.update(module_translations[lang])
+        _FLAT_TRANSLATIONS_CACHE[lang] = result
+    return result
+
 def setup_logging(app):
     handler = logging.StreamHandler(sys.stderr)
     handler.setLevel(logging.INFO)
@@ -111,6 +208,25 @@ def setup_logging(app):
     
     logger.info("Logging setup complete with StreamHandler for ficore_app, flask, and werkzeug")
 
+def create_mongo_client(app):
+    """Build a pooled MongoClient for the configured MONGO_URI."""
+    from pymongo import MongoClient
+    import certifi
+    return MongoClient(
+        app.config['MONGO_URI'],
+        connect=False,
+        tlsCAFile=certifi.where(),
+        maxPoolSize=20,
+        socketTimeoutMS=60000,
+        connectTimeoutMS=30000,
+        serverSelectionTimeoutMS=30000,
+        retryWrites=True
+    )
+
+def get_active_mongo_client(app):
+    """Return the client currently in use, preferring one reinitialized after a failed ping."""
+    return app.config.get('MONGO_CLIENT') or mongo_client
+
 def check_mongodb_connection(mongo_client, app):
     try:
         if mongo_client is None:
@@ -121,48 +237,26 @@ def check_mongodb_connection(mongo_client, app):
             logger.info("MongoDB connection verified with ping")
             return True
         except Exception as e:
-            logger.error(f"MongoDB client is closed: {str(e)}")
+            logger.error("MongoDB client is closed: %s", e)
             try:
-                from pymongo import MongoClient
-                import certifi
-                new_client = MongoClient(
-                    app.config['MONGO_URI'],
-                    connect=False,
-                    tlsCAFile=certifi.where(),
-                    maxPoolSize=20,
-                    socketTimeoutMS=60000,
-                    connectTimeoutMS=30000,
-                    serverSelectionTimeoutMS=30000,
-                    retryWrites=True
-                )
+                new_client = create_mongo_client(app)
                 new_client.admin.command('ping')
                 logger.info("New MongoDB client reinitialized successfully")
                 app.config['MONGO_CLIENT'] = new_client
                 app.config['SESSION_MONGODB'] = new_client
                 return True
             except Exception as reinit_e:
-                logger.error(f"Failed to reinitialize MongoDB client: {str(reinit_e)}")
+                logger.error("Failed to reinitialize MongoDB client: %s", reinit_e)
                 return False
     except Exception as e:
-        logger.error(f"MongoDB connection error: {str(e)}", exc_info=True)
+        logger.error("MongoDB connection error: %s", e, exc_info=True)
         return False
 
 def setup_session(app):
     try:
         if not check_mongodb_connection(mongo_client, app):
             logger.error("MongoDB client is not open, attempting to reinitialize")
-            from pymongo import MongoClient
-            import certifi
-            mongo_client_new = MongoClient(
-                app.config['MONGO_URI'],
-                connect=False,
-                tlsCAFile=certifi.where(),
-                maxPoolSize=20,
-                socketTimeoutMS=60000,
-                connectTimeoutMS=30000,
-                serverSelectionTimeoutMS=30000,
-                retryWrites=True
-            )
+            mongo_client_new = create_mongo_client(app)
             if not check_mongodb_connection(mongo_client_new, app):
                 logger.error("MongoDB client could not be reinitialized, falling back to filesystem session")
                 app.config['SESSION_TYPE'] = 'filesystem'
@@ -171,7 +265,7 @@ def setup_session(app):
                 return
             app.config['MONGO_CLIENT'] = mongo_client_new
         app.config['SESSION_TYPE'] = 'mongodb'
-        app.config['SESSION_MONGODB'] = mongo_client
+        app.config['SESSION_MONGODB'] = get_active_mongo_client(app)
         app.config['SESSION_MONGODB_DB'] = 'ficodb'
         app.config['SESSION_MONGODB_COLLECT'] = 'sessions'
         app.config['SESSION_PERMANENT'] = True
@@ -182,13 +276,54 @@ def setup_session(app):
         app.config['SESSION_COOKIE_HTTPONLY'] = True
         app.config['SESSION_COOKIE_NAME'] = 'ficore_session'
         flask_session.init_app(app)
-        logger.info(f"Session configured: type={app.config['SESSION_TYPE']}, db={app.config['SESSION_MONGODB_DB']}, collection={app.config['SESSION_MONGODB_COLLECT']}")
+        logger.info("Session configured: type=%s, db=%s, collection=%s", app.config['SESSION_TYPE'], app.config['SESSION_MONGODB_DB'], app.config['SESSION_MONGODB_COLLECT'])
     except Exception as e:
-        logger.error(f"Failed to configure session with MongoDB: {str(e)}", exc_info=True)
+        logger.error("Failed to configure session with MongoDB: %s", e, exc_info=True)
         app.config['SESSION_TYPE'] = 'filesystem'
         flask_session.init_app(app)
         logger.info("Session configured with filesystem fallback due to MongoDB error")
 
+def setup_indexes(db):
+    """Create the compound indexes backing the per-user and per-session queries served by this module."""
+    indexes = {
+        'records': [
+            [('user_id', 1), ('type', 1)],
+            [('user_id', 1), ('created_at', -1)]
+        ],
+        'cashflows': [
+            [('user_id', 1), ('type', 1), ('created_at', 1)],
+            [('user_id', 1), ('created_at', -1)]
+        ],
+        'bills': [
+            [('user_id', 1), ('status', 1), ('due_date', 1)],
+            [('session_id', 1), ('status', 1), ('due_date', 1)],
+            [('user_email', 1)]
+        ],
+        'budgets': [
+            [('user_id', 1), ('created_at', -1)],
+            [('session_id', 1), ('created_at', -1)]
+        ],
+        'emergency_funds': [
+            [('user_id', 1), ('created_at', -1)],
+            [('session_id', 1), ('created_at', -1)],
+            [('email', 1), ('created_at', -1)]
+        ],
+        'reminder_logs': [
+            [('user_id', 1), ('read_status', 1)],
+            [('user_id', 1), ('sent_at', -1)]
+        ],
+        'tool_usage': [
+            [('session_id', 1), ('created_at', 1)]
+        ]
+    }
+    for collection_name, keys_list in indexes.items():
+        for keys in keys_list:
+            try:
+                db[collection_name].create_index(keys)
+            except Exception as e:
+                logger.error("Failed to create index %s on %s: %s", keys, collection_name, e)
+    logger.info("Database indexes ensured")
+
 class User:
     def __init__(self, id, email, display_name=None, role='personal'):
         self.id = id
@@ -197,7 +332,7 @@ class User:
         self.role = role
 
     def get(self, key, default=None):
-        user = get_mongo_db().users.find_one({'_id': self.id})
+        user = get_mongo_db().users.find_one({'_id': self.id}, {key: 1})
         return user.get(key, default) if user else default
 
     @property
@@ -237,6 +372,10 @@ def create_app():
     app.config['SMTP_USERNAME'] = os.environ.get('SMTP_USERNAME')
     app.config['SMTP_PASSWORD'] = os.environ.get('SMTP_PASSWORD')
     app.config['BASE_URL'] = os.environ.get('BASE_URL', 'http://localhost:5000')
+    # Compiled templates are reused without stat-ing their source files in production;
+    # elsewhere the setting is left unset so it follows app.debug
+    if os.getenv('FLASK_ENV') == 'production':
+        app.config['TEMPLATES_AUTO_RELOAD'] = False
     
     if not app.config['GOOGLE_CLIENT_ID'] or not app.config['GOOGLE_CLIENT_SECRET']:
         logger.warning("Google OAuth2 credentials not set")
@@ -269,12 +408,12 @@ def create_app():
         try:
             user = get_user(get_mongo_db(), user_id)
             if user is None:
-                logger.warning(f"No user found for ID: {user_id}")
+                logger.warning("No user found for ID: %s", user_id)
             else:
-                logger.info(f"User loaded: {user.username if hasattr(user, 'username') else user_id}")
+                logger.info("User loaded: %s", getattr(user, 'username', user_id))
             return user
         except Exception as e:
-            logger.error(f"Error loading user {user_id}: {str(e)}", exc_info=True)
+            logger.error("Error loading user %s: %s", user_id, e, exc_info=True)
             return None
     
     # Initialize scheduler
@@ -288,22 +427,24 @@ def create_app():
                     scheduler.shutdown(wait=True)
                     logger.info("Scheduler shutdown successfully")
             except Exception as e:
-                logger.error(f"Error shutting down scheduler: {str(e)}", exc_info=True)
+                logger.error("Error shutting down scheduler: %s", e, exc_info=True)
         atexit.register(shutdown_scheduler)
     except Exception as e:
-        logger.error(f"Failed to initialize scheduler: {str(e)}", exc_info=True)
+        logger.error("Failed to initialize scheduler: %s", e, exc_info=True)
+    
+    # Write out queued audit/usage log entries on shutdown
+    atexit.register(flush_insert_queue)
     
     # Initialize database and taxation collections
     with app.app_context():
         initialize_database(app)
         db = get_mongo_db()
+        setup_indexes(db)
         # Initialize taxation collections if not already present
-        if 'tax_rates' not in db.list_collection_names():
-            db.create_collection('tax_rates')
-        if 'payment_locations' not in db.list_collection_names():
-            db.create_collection('payment_locations')
-        if 'tax_reminders' not in db.list_collection_names():
-            db.create_collection('tax_reminders')
+        existing_collections = set(db.list_collection_names())
+        for collection_name in ('tax_rates', 'payment_locations', 'tax_reminders'):
+            if collection_name not in existing_collections:
+                db.create_collection(collection_name)
         # Insert sample tax rates if collection is empty
         if db.tax_rates.count_documents({}) == 0:
             sample_rates = [
@@ -335,9 +476,9 @@ def create_app():
                 'display_name': admin_username
             }
             create_user(db, user_data)
-            logger.info(f"Admin user created with email: {admin_email}")
+            logger.info("Admin user created with email: %s", admin_email)
         else:
-            logger.info(f"Admin user already exists with email: {admin_email}")
+            logger.info("Admin user already exists with email: %s", admin_email)
     
     # Register blueprints - Existing accounting blueprints
     from users.routes import users_bp
@@ -379,7 +520,7 @@ def create_app():
         app.register_blueprint(coins_bp, url_prefix='/coins')
         logger.info("Registered coins blueprint")
     except Exception as e:
-        logger.warning(f"Could not import coins blueprint: {str(e)}")
+        logger.warning("Could not import coins blueprint: %s", e)
     
     app.register_blueprint(creditors_bp, url_prefix='/creditors')
     logger.info("Registered creditors blueprint")
@@ -411,7 +552,7 @@ def create_app():
         app.register_blueprint(admin_bp, url_prefix='/admin')
         logger.info("Registered admin blueprint")
     except Exception as e:
-        logger.warning(f"Could not import admin blueprint: {str(e)}")
+        logger.warning("Could not import admin blueprint: %s", e)
     
     # Register personal finance blueprints
     app.register_blueprint(bill_bp, url_prefix='/personal/bill')
@@ -441,7 +582,7 @@ def create_app():
         try:
             return value
         except Exception as e:
-            logger.error(f"Navigation rendering error: {str(e)}", exc_info=True)
+            logger.error("Navigation rendering error: %s", e, exc_info=True)
             return ''
     
     @app.template_filter('format_number')
@@ -451,7 +592,7 @@ def create_app():
                 return f"{float(value):,.2f}"
             return str(value)
         except (ValueError, TypeError) as e:
-            logger.warning(f"Error formatting number {value}: {str(e)}")
+            logger.warning("Error formatting number %s: %s", value, e)
             return str(value)
     
     @app.template_filter('format_currency')
@@ -464,7 +605,7 @@ def create_app():
                 return f"{symbol}{int(value):,}"
             return f"{symbol}{value:,.2f}"
         except (TypeError, ValueError) as e:
-            logger.warning(f"Error formatting currency {value}: {str(e)}")
+            logger.warning("Error formatting currency %s: %s", value, e)
             return str(value)
     
     @app.template_filter('format_datetime')
@@ -477,11 +618,11 @@ def create_app():
             elif isinstance(value, date):
                 return value.strftime('%B %d, %Y' if locale == 'en' else '%d %B %Y')
             elif isinstance(value, str):
-                parsed = datetime.strptime(value, '%Y-%m-%d')
+                parsed = datetime.fromisoformat(value)
                 return parsed.strftime(format_str)
             return str(value)
         except Exception as e:
-            logger.warning(f"Error formatting datetime {value}: {str(e)}")
+            logger.warning("Error formatting datetime %s: %s", value, e)
             return str(value)
     
     @app.template_filter('format_date')
@@ -494,11 +635,11 @@ def create_app():
             elif isinstance(value, date):
                 return value.strftime(format_str)
             elif isinstance(value, str):
-                parsed = datetime.strptime(value, '%Y-%m-%d').date()
+                parsed = date.fromisoformat(value)
                 return parsed.strftime(format_str)
             return str(value)
         except Exception as e:
-            logger.warning(f"Error formatting date {value}: {str(e)}")
+            logger.warning("Error formatting date %s: %s", value, e)
             return str(value)
     
     @app.template_filter('trans')
@@ -506,7 +647,7 @@ def create_app():
         lang = session.get('lang', 'en')
         translation = trans(key, lang=lang, **kwargs)
         if translation == key:
-            logger.warning(f"Missing translation for key='{key}' in lang='{lang}'")
+            logger.warning("Missing translation for key='%s' in lang='%s'", key, lang)
             return key
         return translation
     
@@ -515,12 +656,7 @@ def create_app():
         lang = session.get('lang', 'en')
         def context_trans(key, **kwargs):
             used_lang = kwargs.pop('lang', lang)
-            return trans(
-                key,
-                lang=used_lang,
-                logger=g.get('logger', logger) if has_request_context() else logger,
-                **kwargs
-            )
+            return trans(key, lang=used_lang, **kwargs)
         return {
             'google_client_id': app.config.get('GOOGLE_CLIENT_ID', ''),
             'trans': context_trans,
@@ -535,10 +671,7 @@ def create_app():
             'current_lang': lang,
             'current_user': current_user if has_request_context() else None,
             'csrf_token': csrf.generate_csrf,
-            'available_languages': [
-                {'code': 'en', 'name': trans('general_english', lang=lang)},
-                {'code': 'ha', 'name': trans('general_hausa', lang=lang)}
-            ]
+            'available_languages': get_available_languages(lang)
         }
     
     # Security headers
@@ -566,7 +699,9 @@ def create_app():
             new_lang = data.get('language', 'en')
             
             if new_lang in ['en', 'ha']:
-                session['lang'] = new_lang
+                # Only touch the session when the language actually changes
+                if session.get('lang') != new_lang:
+                    session['lang'] = new_lang
                 
                 # Update user preference if authenticated
                 if current_user.is_authenticated:
@@ -576,10 +711,9 @@ def create_app():
                             {'$set': {'language': new_lang}}
                         )
                     except Exception as e:
-                        logger.warning(f"Could not update user language preference: {str(e)}")
+                        logger.warning("Could not update user language preference: %s", e)
                 
-                logger.info(f"Language changed to {new_lang}", 
-                           extra={'session_id': session.get('sid', 'no-session-id')})
+                logger.info("Language changed to %s", new_lang)
                 
                 return jsonify({
                     'success': True, 
@@ -592,8 +726,7 @@ def create_app():
                 }), 400
                 
         except Exception as e:
-            logger.error(f"Error changing language: {str(e)}", 
-                        extra={'session_id': session.get('sid', 'no-session-id')})
+            logger.error("Error changing language: %s", e)
             return jsonify({
                 'success': False, 
                 'message': trans('general_error')
@@ -603,23 +736,17 @@ def create_app():
     @app.route('/', methods=['GET', 'HEAD'])
     def index():
         lang = session.get('lang', 'en')
-        logger.info(f"Serving index page, authenticated: {current_user.is_authenticated}, user: {current_user.username if current_user.is_authenticated and hasattr(current_user, 'username') else 'None'}")
+        logger.info("Serving index page, authenticated: %s, user: %s", current_user.is_authenticated, getattr(current_user, 'username', None) if current_user.is_authenticated else None)
         if request.method == 'HEAD':
             return '', 200
         if current_user.is_authenticated:
-            if current_user.role == 'agent':
-                return redirect(url_for('agents_bp.dashboard'))
-            elif current_user.role == 'trader':
-                return redirect(url_for('dashboard_bp.index'))
-            elif current_user.role == 'admin':
-                return redirect(url_for('admin_bp.dashboard'))
-            elif current_user.role == 'personal':
-                return redirect(url_for('general_dashboard'))
-            else:
-                return render_template('general/home.html', t=trans, lang=lang)
+            endpoint = ROLE_HOME_ENDPOINTS.get(current_user.role)
+            if endpoint:
+                return redirect(url_for(endpoint))
+            return render_template('general/home.html', t=trans, lang=lang)
         try:
             courses = app.config.get('COURSES', [])
-            logger.info(f"Retrieved {len(courses)} courses")
+            logger.info("Retrieved %d courses", len(courses))
             return render_template(
                 'index.html',
                 t=trans,
@@ -629,7 +756,7 @@ def create_app():
                 title=trans('general_welcome', lang=lang)
             )
         except Exception as e:
-            logger.error(f"Error in index route: {str(e)}", exc_info=True)
+            logger.error("Error in index route: %s", e, exc_info=True)
             flash(trans('general_error', default='An error occurred'), 'danger')
             return render_template('error.html', t=trans, lang=lang, error=str(e)), 500
     
@@ -637,59 +764,51 @@ def create_app():
     @ensure_session_id
     def general_dashboard():
         lang = session.get('lang', 'en')
-        logger.info(f"Serving general_dashboard for {'anonymous' if session.get('is_anonymous') else 'authenticated' if current_user.is_authenticated else 'no_session'} user")
+        logger.info("Serving general_dashboard for %s user", 'anonymous' if session.get('is_anonymous') else 'authenticated' if current_user.is_authenticated else 'no_session')
         data = {}
         try:
-            filter_kwargs = {'user_id': current_user.id} if current_user.is_authenticated else {'session_id': session.get('sid', 'no-session-id')}
-            fh_records = get_financial_health(get_mongo_db(), filter_kwargs)
-            fh_records = [to_dict_financial_health(fh) for fh in fh_records]
-            data['financial_health'] = fh_records[0] if fh_records else {'score': None, 'status': None}
-            budget_records = get_budgets(get_mongo_db(), filter_kwargs)
-            budget_records = [to_dict_budget(b) for b in budget_records]
-            data['budget'] = budget_records[0] if budget_records else {'surplus_deficit': None, 'savings_goal': None}
-            bills = get_bills(get_mongo_db(), filter_kwargs)
-            bills = [to_dict_bill(b) for b in bills]
-            total_amount = sum(bill['amount'] for bill in bills if bill['amount'] is not None) if bills else 0
-            unpaid_amount = sum(bill['amount'] for bill in bills if bill['amount'] is not None and bill['status'].lower() != 'paid') if bills else 0
+            db = get_mongo_db()
+            sid = session.get('sid', 'no-session-id')
+            filter_kwargs = {'user_id': current_user.id} if current_user.is_authenticated else {'session_id': sid}
+            latest_fh = next(iter(get_financial_health(db, filter_kwargs)), None)
+            data['financial_health'] = to_dict_financial_health(latest_fh) if latest_fh else DASHBOARD_DEFAULTS['financial_health']
+            latest_budget = next(iter(get_budgets(db, filter_kwargs)), None)
+            data['budget'] = to_dict_budget(latest_budget) if latest_budget else DASHBOARD_DEFAULTS['budget']
+            bills = []
+            total_amount = unpaid_amount = 0
+            for record in get_bills(db, filter_kwargs):
+                bill = to_dict_bill(record)
+                bills.append(bill)
+                if bill['amount'] is not None:
+                    total_amount += bill['amount']
+                    if bill['status'].lower() != 'paid':
+                        unpaid_amount += bill['amount']
             data['bills'] = {'bills': bills, 'total_amount': total_amount, 'unpaid_amount': unpaid_amount}
-            nw_records = get_net_worth(get_mongo_db(), filter_kwargs)
-            nw_records = [to_dict_net_worth(nw) for nw in nw_records]
-            data['net_worth'] = nw_records[0] if nw_records else {'net_worth': None, 'total_assets': None}
-            ef_records = get_emergency_funds(get_mongo_db(), filter_kwargs)
-            ef_records = [to_dict_emergency_fund(ef) for ef in ef_records]
-            data['emergency_fund'] = ef_records[0] if ef_records else {'target_amount': None, 'savings_gap': None}
-            lp_records = get_learning_progress(get_mongo_db(), filter_kwargs)
+            latest_nw = next(iter(get_net_worth(db, filter_kwargs)), None)
+            data['net_worth'] = to_dict_net_worth(latest_nw) if latest_nw else DASHBOARD_DEFAULTS['net_worth']
+            latest_ef = next(iter(get_emergency_funds(db, filter_kwargs)), None)
+            data['emergency_fund'] = to_dict_emergency_fund(latest_ef) if latest_ef else DASHBOARD_DEFAULTS['emergency_fund']
+            lp_records = get_learning_progress(db, filter_kwargs)
             data['learning_progress'] = {lp['course_id']: to_dict_learning_progress(lp) for lp in lp_records} if lp_records else {}
-            quiz_records = get_quiz_results(get_mongo_db(), filter_kwargs)
-            quiz_records = [to_dict_quiz_result(qr) for qr in quiz_records]
-            data['quiz'] = quiz_records[0] if quiz_records else {'personality': None, 'score': None}
-            logger.info(f"Retrieved data for session {session.get('sid', 'no-session-id')}")
+            latest_quiz = next(iter(get_quiz_results(db, filter_kwargs)), None)
+            data['quiz'] = to_dict_quiz_result(latest_quiz) if latest_quiz else DASHBOARD_DEFAULTS['quiz']
+            logger.info("Retrieved data for session %s", sid)
             return render_template('personal/GENERAL/general_dashboard.html', 
                                  data=data, 
                                  t=trans, 
                                  lang=lang,
                                  title=trans('general_dashboard', lang=lang))
         except Exception as e:
-            logger.error(f"Error in general_dashboard: {str(e)}", exc_info=True)
+            logger.error("Error in general_dashboard: %s", e, exc_info=True)
             flash(trans('general_error', default='An error occurred'), 'danger')
-            default_data = {
-                'financial_health': {'score': None, 'status': None},
-                'budget': {'surplus_deficit': None, 'savings_goal': None},
-                'bills': {'bills': [], 'total_amount': 0, 'unpaid_amount': 0},
-                'net_worth': {'net_worth': None, 'total_assets': None},
-                'emergency_fund': {'target_amount': None, 'savings_gap': None},
-                'learning_progress': {},
-                'quiz': {'personality': None, 'score': None}
-            }
             return render_template('personal/GENERAL/general_dashboard.html', 
-                                 data=default_data, 
+                                 data=DASHBOARD_DEFAULTS, 
                                  t=trans, 
                                  lang=lang,
                                  title=trans('general_dashboard', lang=lang)), 500
     
     @app.route('/logout')
     def logout():
-        lang = session.get('lang', 'en')
         logger.info("Logging out user")
         try:
             session_lang = session.get('lang', 'en')
@@ -698,7 +817,7 @@ def create_app():
             flash(trans('general_logout_successful', default='Successfully logged out'), 'success')
             return redirect(url_for('index'))
         except Exception as e:
-            logger.error(f"Error in logout: {str(e)}", exc_info=True)
+            logger.error("Error in logout: %s", e, exc_info=True)
             flash(trans('general_error', default='An error occurred'), 'danger')
             return redirect(url_for('index'))
     
@@ -740,12 +859,12 @@ def create_app():
         logger.info("Health check")
         status = {"status": "healthy"}
         try:
-            if not check_mongodb_connection(mongo_client, app):
+            if not check_mongodb_connection(get_active_mongo_client(app), app):
                 raise RuntimeError("MongoDB connection unavailable")
             get_mongo_db().command('ping')
             return jsonify(status), 200
         except Exception as e:
-            logger.error(f"Health check failed: {str(e)}", exc_info=True)
+            logger.error("Health check failed: %s", e, exc_info=True)
             status["status"] = "unhealthy"
             status["details"] = str(e)
             return jsonify(status), 500
@@ -757,19 +876,10 @@ def create_app():
             if lang not in ['en', 'ha']:
                 return jsonify({'error': trans('general_invalid_language')}), 400
             
-            all_translations = get_all_translations()
-            result = {}
-            
-            # Flatten all translations for the requested language
-            for module_name, module_translations in all_translations.items():
-                if lang in module_translations:
-                    result.update(module_translations[lang])
-            
-            return jsonify({'translations': result})
+            return jsonify({'translations': get_flat_translations(lang)})
             
         except Exception as e:
-            logger.error(f"API translations error: {str(e)}", 
-                        extra={'session_id': session.get('sid', 'no-session-id')})
+            logger.error("API translations error: %s", e)
             return jsonify({'error': trans('general_error')}), 500
     
     @app.route('/api/translate')
@@ -786,8 +896,7 @@ def create_app():
             return jsonify({'key': key, 'translation': translation, 'lang': lang})
             
         except Exception as e:
-            logger.error(f"API translate error: {str(e)}", 
-                        extra={'session_id': session.get('sid', 'no-session-id')})
+            logger.error("API translate error: %s", e)
             return jsonify({'error': trans('general_error')}), 500
     
     @app.route('/set_language/<lang>')
@@ -798,17 +907,17 @@ def create_app():
             session['lang'] = new_lang
             if current_user.is_authenticated:
                 get_mongo_db().users.update_one({'_id': current_user.id}, {'$set': {'language': new_lang}})
-            logger.info(f"Language set to {new_lang}")
+            logger.info("Language set to %s", new_lang)
             flash(trans('general_language_changed', default='Language updated successfully'), 'success')
         except Exception as e:
-            logger.error(f"Session operation failed: {str(e)}")
+            logger.error("Session operation failed: %s", e)
             flash(trans('general_invalid_language', default='Invalid language'), 'danger')
         return redirect(request.referrer or url_for('index'))
     
     @app.route('/acknowledge_consent', methods=['POST'])
     def acknowledge_consent():
         if request.method != 'POST':
-            logger.warning(f"Invalid method {request.method} for consent acknowledgement")
+            logger.warning("Invalid method %s for consent acknowledgement", request.method)
             return '', 400
         try:
             session['consent_acknowledged'] = {
@@ -817,9 +926,9 @@ def create_app():
                 'ip': request.remote_addr,
                 'user_agent': request.headers.get('User-Agent')
             }
-            logger.info(f"Consent acknowledged for session {session.get('sid', 'no-session-id')} from IP {request.remote_addr}")
+            logger.info("Consent acknowledged for session %s from IP %s", session.get('sid', 'no-session-id'), request.remote_addr)
         except Exception as e:
-            logger.error(f"Session operation failed: {str(e)}")
+            logger.error("Session operation failed: %s", e)
         response = make_response('', 204)
         response.headers['Cache-Control'] = 'no-store'
         response.headers['X-Content-Type-Options'] = 'nosniff'
@@ -832,24 +941,19 @@ def create_app():
         try:
             db = get_mongo_db()
             user_id = current_user.id
-            creditors_pipeline = [
-                {'$match': {'user_id': user_id, 'type': 'creditor'}},
-                {'$group': {'_id': None, 'total': {'$sum': '$amount_owed'}}}
-            ]
-            creditors_result = list(db.records.aggregate(creditors_pipeline))
-            total_i_owe = creditors_result[0]['total'] if creditors_result else 0
-            debtors_pipeline = [
-                {'$match': {'user_id': user_id, 'type': 'debtor'}},
-                {'$group': {'_id': None, 'total': {'$sum': '$amount_owed'}}}
+            pipeline = [
+                {'$match': {'user_id': user_id, 'type': {'$in': ['creditor', 'debtor']}}},
+                {'$group': {'_id': '$type', 'total': {'$sum': '$amount_owed'}}}
             ]
-            debtors_result = list(db.records.aggregate(debtors_pipeline))
-            total_i_am_owed = debtors_result[0]['total'] if debtors_result else 0
+            totals = {result['_id']: result['total'] for result in db.records.aggregate(pipeline)}
+            total_i_owe = totals.get('creditor', 0)
+            total_i_am_owed = totals.get('debtor', 0)
             return jsonify({
                 'totalIOwe': total_i_owe,
                 'totalIAmOwed': total_i_am_owed
             })
         except Exception as e:
-            logger.error(f"Error fetching debt summary: {str(e)}")
+            logger.error("Error fetching debt summary: %s", e)
             return jsonify({'error': 'Failed to fetch debt summary'}), 500
     
     @app.route('/api/cashflow-summary')
@@ -861,18 +965,13 @@ def create_app():
             now = datetime.utcnow()
             month_start = datetime(now.year, now.month, 1)
             next_month = month_start.replace(month=month_start.month + 1) if month_start.month < 12 else month_start.replace(year=month_start.year + 1, month=1)
-            receipts_pipeline = [
-                {'$match': {'user_id': user_id, 'type': 'receipt', 'created_at': {'$gte': month_start, '$lt': next_month}}},
-                {'$group': {'_id': None, 'total': {'$sum': '$amount'}}}
-            ]
-            receipts_result = list(db.cashflows.aggregate(receipts_pipeline))
-            total_receipts = receipts_result[0]['total'] if receipts_result else 0
-            payments_pipeline = [
-                {'$match': {'user_id': user_id, 'type': 'payment', 'created_at': {'$gte': month_start, '$lt': next_month}}},
-                {'$group': {'_id': None, 'total': {'$sum': '$amount'}}}
+            pipeline = [
+                {'$match': {'user_id': user_id, 'type': {'$in': ['receipt', 'payment']}, 'created_at': {'$gte': month_start, '$lt': next_month}}},
+                {'$group': {'_id': '$type', 'total': {'$sum': '$amount'}}}
             ]
-            payments_result = list(db.cashflows.aggregate(payments_pipeline))
-            total_payments = payments_result[0]['total'] if payments_result else 0
+            totals = {result['_id']: result['total'] for result in db.cashflows.aggregate(pipeline)}
+            total_receipts = totals.get('receipt', 0)
+            total_payments = totals.get('payment', 0)
             net_cashflow = total_receipts - total_payments
             return jsonify({
                 'netCashflow': net_cashflow,
@@ -880,7 +979,7 @@ def create_app():
                 'totalPayments': total_payments
             })
         except Exception as e:
-            logger.error(f"Error fetching cashflow summary: {str(e)}")
+            logger.error("Error fetching cashflow summary: %s", e)
             return jsonify({'error': 'Failed to fetch cashflow summary'}), 500
     
     @app.route('/api/inventory-summary')
@@ -907,7 +1006,7 @@ def create_app():
                 'totalValue': total_value
             })
         except Exception as e:
-            logger.error(f"Error fetching inventory summary: {str(e)}")
+            logger.error("Error fetching inventory summary: %s", e)
             return jsonify({'error': 'Failed to fetch inventory summary'}), 500
     
     @app.route('/api/recent-activity')
@@ -918,7 +1017,8 @@ def create_app():
             user_id = current_user.id
             activities = []
             recent_records = list(db.records.find(
-                {'user_id': user_id}
+                {'user_id': user_id},
+                {'type': 1, 'name': 1, 'amount_owed': 1, 'created_at': 1}
             ).sort('created_at', -1).limit(3))
             for record in recent_records:
                 activity_type = 'debt_added'
@@ -930,7 +1030,8 @@ def create_app():
                     'timestamp': record['created_at']
                 })
             recent_cashflows = list(db.cashflows.find(
-                {'user_id': user_id}
+                {'user_id': user_id},
+                {'type': 1, 'party_name': 1, 'amount': 1, 'created_at': 1}
             ).sort('created_at', -1).limit(3))
             for cashflow in recent_cashflows:
                 activity_type = 'money_in' if cashflow['type'] == 'receipt' else 'money_out'
@@ -947,7 +1048,7 @@ def create_app():
                 activity['timestamp'] = activity['timestamp'].isoformat()
             return jsonify(activities)
         except Exception as e:
-            logger.error(f"Error fetching recent activity: {str(e)}")
+            logger.error("Error fetching recent activity: %s", e)
             return jsonify({'error': 'Failed to fetch recent activity'}), 500
     
     @app.route('/api/notifications/count')
@@ -962,7 +1063,7 @@ def create_app():
             })
             return jsonify({'count': count})
         except Exception as e:
-            logger.error(f"Error fetching notification count: {str(e)}")
+            logger.error("Error fetching notification count: %s", e)
             return jsonify({'error': 'Failed to fetch notification count'}), 500
     
     @app.route('/api/notifications')
@@ -971,13 +1072,14 @@ def create_app():
         try:
             db = get_mongo_db()
             user_id = current_user.id
-            notifications = list(db.reminder_logs.find({
-                'user_id': user_id
-            }).sort('sent_at', -1).limit(10))
+            notifications = list(db.reminder_logs.find(
+                {'user_id': user_id},
+                {'_id': 0, 'notification_id': 1, 'message': 1, 'type': 1, 'sent_at': 1, 'read_status': 1}
+            ).sort('sent_at', -1).limit(10))
             notification_ids = [n['notification_id'] for n in notifications if not n.get('read_status', False)]
             if notification_ids:
                 db.reminder_logs.update_many(
-                    {'notification_id': {'$in': notification_ids}},
+                    {'user_id': user_id, 'notification_id': {'$in': notification_ids}},
                     {'$set': {'read_status': True}}
                 )
             result = [{
@@ -989,7 +1091,7 @@ def create_app():
             } for n in notifications]
             return jsonify(result)
         except Exception as e:
-            logger.error(f"Error fetching notifications: {str(e)}")
+            logger.error("Error fetching notifications: %s", e)
             return jsonify({'error': 'Failed to fetch notifications'}), 500
     
     @app.route('/feedback', methods=['GET', 'POST'])
@@ -997,38 +1099,23 @@ def create_app():
     def feedback():
         lang = session.get('lang', 'en')
         logger.info("Handling feedback")
-        tool_options = [
-            ['profile', trans('general_profile', default='Profile')],
-            ['coins', trans('coins_dashboard', default='Coins')],
-            ['debtors', trans('debtors_dashboard', default='Debtors')],
-            ['creditors', trans('creditors_dashboard', default='Creditors')],
-            ['receipts', trans('receipts_dashboard', default='Receipts')],
-            ['payment', trans('payments_dashboard', default='Payments')],
-            ['inventory', trans('inventory_dashboard', default='Inventory')],
-            ['report', trans('reports_dashboard', default='Reports')],
-            ['financial_health', trans('financial_health_calculator', default='Financial Health')],
-            ['budget', trans('budget_budget_planner', default='Budget')],
-            ['bill', trans('bill_bill_planner', default='Bill')],
-            ['net_worth', trans('net_worth_calculator', default='Net Worth')],
-            ['emergency_fund', trans('emergency_fund_calculator', default='Emergency Fund')],
-            ['learning', trans('learning_hub_courses', default='Learning')],
-            ['quiz', trans('quiz_personality_quiz', default='Quiz')]
-        ]
+        tool_options = get_feedback_tool_options(lang)
         if request.method == 'POST':
             try:
                 from models import create_feedback
                 tool_name = request.form.get('tool_name')
                 rating = request.form.get('rating')
                 comment = request.form.get('comment', '').strip()
-                valid_tools = [option[0] for option in tool_options]
-                if not tool_name or tool_name not in valid_tools:
-                    logger.error(f"Invalid feedback tool: {tool_name}")
+                if tool_name not in FEEDBACK_TOOL_VALUES:
+                    logger.error("Invalid feedback tool: %s", tool_name)
                     flash(trans('general_invalid_input', default='Please select a valid tool'), 'danger')
                     return render_template('personal/GENERAL/feedback.html', t=trans, lang=lang, tool_options=tool_options)
-                if not rating or not rating.isdigit() or int(rating) < 1 or int(rating) > 5:
-                    logger.error(f"Invalid rating: {rating}")
+                if rating not in FEEDBACK_RATINGS:
+                    logger.error("Invalid rating: %s", rating)
                     flash(trans('general_invalid_input', default='Please provide a rating between 1 and 5'), 'danger')
                     return render_template('personal/GENERAL/feedback.html', t=trans, lang=lang, tool_options=tool_options)
+                now = datetime.utcnow()
+                sid = session.get('sid', 'no-session-id')
                 if current_user.is_authenticated:
                     from coins.routes import get_user_query
                     query = get_user_query(str(current_user.id))
@@ -1039,32 +1126,32 @@ def create_app():
                         'user_id': str(current_user.id),
                         'amount': -1,
                         'type': 'spend',
-                        'ref': f"FEEDBACK_{datetime.utcnow().isoformat()}",
-                        'date': datetime.utcnow()
+                        'ref': f"FEEDBACK_{now.isoformat()}",
+                        'date': now
                     })
                 feedback_entry = {
                     'user_id': current_user.id if current_user.is_authenticated else None,
-                    'session_id': session.get('sid', 'no-session-id'),
+                    'session_id': sid,
                     'tool_name': tool_name,
                     'rating': int(rating),
                     'comment': comment or None,
-                    'timestamp': datetime.utcnow()
+                    'timestamp': now
                 }
                 create_feedback(get_mongo_db(), feedback_entry)
-                get_mongo_db().audit_logs.insert_one({
+                queue_insert(get_mongo_db().audit_logs, {
                     'admin_id': 'system',
                     'action': 'submit_feedback',
                     'details': {'user_id': str(current_user.id) if current_user.is_authenticated else None, 'tool_name': tool_name},
-                    'timestamp': datetime.utcnow()
+                    'timestamp': now
                 })
-                logger.info(f"Feedback submitted: tool={tool_name}, rating={rating}, session={session.get('sid', 'no-session-id')}")
+                logger.info("Feedback submitted: tool=%s, rating=%s, session=%s", tool_name, rating, sid)
                 flash(trans('general_thank_you', default='Thank you for your feedback!'), 'success')
                 return redirect(url_for('index'))
             except ValueError as e:
-                logger.error(f"User not found: {str(e)}")
+                logger.error("User not found: %s", e)
                 flash(trans('general_error', default='User not found'), 'danger')
             except Exception as e:
-                logger.error(f"Error processing feedback: {str(e)}", exc_info=True)
+                logger.error("Error processing feedback: %s", e, exc_info=True)
                 flash(trans('general_error', default='Error occurred during feedback submission'), 'danger')
                 return render_template('personal/GENERAL/feedback.html', t=trans, lang=lang, tool_options=tool_options), 500
         logger.info("Rendering feedback index template")
@@ -1104,20 +1191,7 @@ def create_app():
     
     @app.route('/manifest.json')
     def manifest():
-        return {
-            'name': 'FiCore',
-            'short_name': 'FiCore',
-            'description': 'Manage your finances with ease',
-            'theme_color': '#007bff',
-            'background_color': '#ffffff',
-            'display': 'standalone',
-            'scope': '/',
-            'start_url': '/',
-            'icons': [
-                {'src': '/static/icons/icon-192x192.png', 'sizes': '192x192', 'type': 'image/png'},
-                {'src': '/static/icons/icon-512x512.png', 'sizes': '512x512', 'type': 'image/png'}
-            ]
-        }
+        return MANIFEST
     
     @app.route('/robots.txt')
     def robots_txt():
@@ -1126,54 +1200,55 @@ def create_app():
     @app.errorhandler(403)
     def forbidden(e):
         lang = session.get('lang', 'en')
+        message = trans('general_access_denied', lang=lang)
         return render_template('errors/403.html', 
-                             message=trans('general_access_denied', default='Forbidden'), 
+                             message=message, 
                              t=trans, 
                              lang=lang,
-                             title=trans('general_access_denied', lang=lang)), 403
+                             title=message), 403
     
     @app.errorhandler(404)
     def page_not_found(e):
         lang = session.get('lang', 'en')
-        logger.error(f"Error 404: {str(e)}")
+        message = trans('general_page_not_found', lang=lang)
+        logger.error("Error 404: %s", e)
         return render_template('errors/404.html', 
-                             message=trans('general_page_not_found', default='Page not found'), 
+                             message=message, 
                              t=trans, 
                              lang=lang,
-                             title=trans('general_page_not_found', lang=lang)), 404
+                             title=message), 404
     
     @app.errorhandler(500)
     def internal_server_error(e):
         lang = session.get('lang', 'en')
-        logger.error(f"Server error: {str(e)}", exc_info=True)
+        message = trans('general_error', lang=lang)
+        logger.error("Server error: %s", e, exc_info=True)
         return render_template('errors/500.html', 
-                             message=trans('general_error', default='Internal server error'), 
+                             message=message, 
                              t=trans, 
                              lang=lang,
-                             title=trans('general_error', lang=lang)), 500
+                             title=message), 500
     
     @app.errorhandler(CSRFError)
     def handle_csrf_error(e):
         lang = session.get('lang', 'en')
-        logger.error(f"CSRF error: {str(e)}")
+        logger.error("CSRF error: %s", e)
         return jsonify({'error': 'CSRF token invalid'}), 400
     
     @app.before_request
     def before_request():
-        if request.path.startswith('/static/') or request.path in [
-            '/manifest.json', '/service-worker.js', '/favicon.ico', '/robots.txt'
-        ]:
-            logger.info(f"Skipping session setup for request: {request.path}")
+        if request.path.startswith('/static/') or request.path in SESSIONLESS_PATHS:
+            logger.info("Skipping session setup for request: %s", request.path)
             return
-        logger.info(f"Starting before_request for path: {request.path}")
+        logger.info("Starting before_request for path: %s", request.path)
         try:
             if 'sid' not in session:
                 session['sid'] = session.sid
                 session['is_anonymous'] = not current_user.is_authenticated
-                logger.info(f"Session ID set: {session['sid']}, is_anonymous: {session['is_anonymous']}")
+                logger.info("Session ID set: %s, is_anonymous: %s", session['sid'], session['is_anonymous'])
             if 'lang' not in session:
                 session['lang'] = request.accept_languages.best_match(['en', 'ha'], 'en')
-                logger.info(f"Set default language to {session['lang']}")
+                logger.info("Set default language to %s", session['lang'])
             
             # Make translation functions available globally
             g.trans = trans
@@ -1184,7 +1259,7 @@ def create_app():
                 if 'session_id' not in session:
                     session['session_id'] = str(uuid.uuid4())
                 db = get_mongo_db()
-                user = db.users.find_one({'_id': current_user.id})
+                user = db.users.find_one({'_id': current_user.id}, {'setup_complete': 1})
                 if user and not user.get('setup_complete', False):
                     allowed_endpoints = [
                         'users_bp.personal_setup_wizard',
@@ -1202,7 +1277,7 @@ def create_app():
                             return redirect(url_for('users_bp.agent_setup_wizard'))
                         return redirect(url_for('users_bp.personal_setup_wizard'))
         except Exception as e:
-            logger.error(f"Error in before_request: {str(e)}", exc_info=True)
+            logger.error("Error in before_request: %s", e, exc_info=True)
     
     # Development routes (only in debug mode)
     if app.debug:
@@ -1,5 +1,6 @@
 import logging
 from flask import session, has_request_context, g, request  
+from functools import lru_cache
 from typing import Dict, Optional, Union
 
 # Set up logger to match app.py
@@ -55,7 +56,7 @@ try:
     from .translations_mailersend import MAILERSEND_TRANSLATIONS
         
 except ImportError as e:
-    logger.error(f"Failed to import translation module: {str(e)}", exc_info=True)
+    logger.error("Failed to import translation module: %s", e, exc_info=True)
     raise
 
 # Map module names to translation dictionaries
@@ -149,37 +150,25 @@ GENERAL_SPECIFIC_KEYS = {
 for module_name, translations in translation_modules.items():
     for lang in ['en', 'ha']:
         lang_dict = translations.get(lang, {})
-        logger.info(f"Loaded {len(lang_dict)} translations for module '{module_name}', lang='{lang}'")
+        logger.info("Loaded %s translations for module '%s', lang='%s'", len(lang_dict), module_name, lang)
 
-def trans(key: str, lang: Optional[str] = None, **kwargs: str) -> str:
-    """
-    Translate a key using the appropriate module's translation dictionary.
-    
-    Args:
-        key: The translation key (e.g., 'bill_submit', 'general_welcome', 'quiz_yes', 'Yes').
-        lang: Language code ('en', 'ha'). Defaults to session['lang'] or 'en'.
-        **kwargs: String formatting parameters for the translated string.
-    
-    Returns:
-        The translated string, falling back to English or the key itself if missing.
-        Applies string formatting with kwargs if provided.
-    
-    Notes:
-        - Uses session['lang'] if lang is None and request context exists.
-        - Logs warnings for missing translations.
-        - Uses g.logger if available, else the default logger.
-        - Checks general translations for common UI elements without prefixes.
+def _log_context():
+    """Return the logger and session id to report translation problems with."""
+    if has_request_context():
+        return g.get('logger', logger), session.get('sid', 'no-session-id')
+    return logger, 'no-session-id'
+
+@lru_cache(maxsize=8192)
+def _resolve_translation(key: str, lang: str, quiz_context: bool = False):
     """
-    current_logger = g.get('logger', logger) if has_request_context() else logger
-    session_id = session.get('sid', 'no-session-id') if has_request_context() else 'no-session-id'
+    Resolve a key to its module and raw translation string for a language.
 
-    # Default to session language or 'en'
-    if lang is None:
-        lang = session.get('lang', 'en') if has_request_context() else 'en'
-    if lang not in ['en', 'ha']:
-        current_logger.warning(f"Invalid language '{lang}', falling back to 'en'", extra={'session_id': session_id})
-        lang = 'en'
+    Translation dictionaries are static, so results are cached per (key, lang, quiz_context).
 
+    Returns:
+        Tuple of (module_name, translation, missing) where translation falls back to
+        English, then the key itself, and missing is True when no translation was found.
+    """
     # Determine module based on key prefix or specific keys
     module_name = 'general'  # Default to general instead of core
     
@@ -190,7 +179,7 @@ def trans(key: str, lang: Optional[str] = None, **kwargs: str) -> str:
             break
     
     # Check for quiz-specific keys
-    if key in QUIZ_SPECIFIC_KEYS and has_request_context() and '/quiz/' in request.path:
+    if quiz_context:
         module_name = 'quiz'
     
     # Check for general-specific keys (common UI elements)
@@ -212,28 +201,69 @@ def trans(key: str, lang: Optional[str] = None, **kwargs: str) -> str:
     translation = lang_dict.get(key)
 
     # Fallback to English, then key
+    missing = False
     if translation is None:
         en_dict = module.get('en', {})
         translation = en_dict.get(key, key)
-        if translation == key:
-            current_logger.warning(
-                f"Missing translation for key='{key}' in module '{module_name}', lang='{lang}'",
-                extra={'session_id': session_id}
-            )
+        missing = translation == key
+
+    return module_name, translation, missing
+
+def trans(key: str, lang: Optional[str] = None, **kwargs: str) -> str:
+    """
+    Translate a key using the appropriate module's translation dictionary.
+    
+    Args:
+        key: The translation key (e.g., 'bill_submit', 'general_welcome', 'quiz_yes', 'Yes').
+        lang: Language code ('en', 'ha'). Defaults to session['lang'] or 'en'.
+        **kwargs: String formatting parameters for the translated string.
+    
+    Returns:
+        The translated string, falling back to English or the key itself if missing.
+        Applies string formatting with kwargs if provided.
+    
+    Notes:
+        - Uses session['lang'] if lang is None and request context exists.
+        - Logs warnings for missing translations.
+        - Uses g.logger if available, else the default logger.
+        - Checks general translations for common UI elements without prefixes.
+    """
+    # Default to session language or 'en'
+    if lang is None:
+        lang = session.get('lang', 'en') if has_request_context() else 'en'
+    if lang not in ['en', 'ha']:
+        current_logger, session_id = _log_context()
+        current_logger.warning("Invalid language '%s', falling back to 'en'", lang, extra={'session_id': session_id})
+        lang = 'en'
+
+    # Quiz-specific keys resolve differently inside the quiz pages, so that context is part of the cache key
+    quiz_context = key in QUIZ_SPECIFIC_KEYS and has_request_context() and '/quiz/' in request.path
+    module_name, translation, missing = _resolve_translation(key, lang, quiz_context)
+    if missing:
+        current_logger, session_id = _log_context()
+        current_logger.warning(
+            "Missing translation for key='%s' in module '%s', lang='%s'", key, module_name, lang,
+            extra={'session_id': session_id}
+        )
 
     # Apply string formatting
     try:
         return translation.format(**kwargs) if kwargs else translation
     except (KeyError, ValueError) as e:
+        current_logger, session_id = _log_context()
         current_logger.error(
-            f"Formatting failed for key '{key}', lang='{lang}', kwargs={kwargs}, error={str(e)}",
+            "Formatting failed for key '%s', lang='%s', kwargs=%s, error=%s", key, lang, kwargs, e,
             extra={'session_id': session_id}
         )
         return translation
 
+# Language-bound trans callables handed out by get_translations, built once per language
+_TRANSLATIONS_BY_LANG: Dict[str, Dict[str, callable]] = {}
+
 def get_translations(lang: Optional[str] = None) -> Dict[str, callable]:
     """
     Return a dictionary with a trans callable for the specified language.
+    The callable is created once per language and reused.
 
     Args:
         lang: Language code ('en', 'ha'). Defaults to session['lang'] or 'en'.
@@ -244,11 +274,15 @@ def get_translations(lang: Optional[str] = None) -> Dict[str, callable]:
     if lang is None:
         lang = session.get('lang', 'en') if has_request_context() else 'en'
     if lang not in ['en', 'ha']:
-        logger.warning(f"Invalid language '{lang}', falling back to 'en'")
+        logger.warning("Invalid language '%s', falling back to 'en'", lang)
         lang = 'en'
-    return {
-        'trans': lambda key, **kwargs: trans(key, lang=lang, **kwargs)
-    }
+    translations = _TRANSLATIONS_BY_LANG.get(lang)
+    if translations is None:
+        translations = {
+            'trans': lambda key, **kwargs: trans(key, lang=lang, **kwargs)
+        }
+        _TRANSLATIONS_BY_LANG[lang] = translations
+    return translations
 
 def get_all_translations() -> Dict[str, Dict[str, Dict[str, str]]]:
     """
@@ -1,5 +1,8 @@
 import re
 import logging
+import queue
+import threading
+import time
 import uuid
 from datetime import datetime
 from flask import session, has_request_context, current_app, g
@@ -37,15 +40,16 @@ logger = SessionAdapter(root_logger, {})
 def create_anonymous_session():
     """Create a guest session for anonymous access."""
     try:
-        session['sid'] = str(uuid.uuid4())
-        session['is_anonymous'] = True
-        session['created_at'] = datetime.utcnow().isoformat()
-        # Set default language if not already set
-        if 'lang' not in session:
-            session['lang'] = 'en'
-        logger.info(f"Created anonymous session: {session['sid']}")
+        session.update({
+            'sid': str(uuid.uuid4()),
+            'is_anonymous': True,
+            'created_at': datetime.utcnow().isoformat(),
+            # Keep the existing language, defaulting to English
+            'lang': session.get('lang', 'en')
+        })
+        logger.info("Created anonymous session: %s", session['sid'])
     except Exception as e:
-        logger.error(f"Error creating anonymous session: {str(e)}", exc_info=True)
+        logger.error("Error creating anonymous session: %s", e, exc_info=True)
 
 def trans_function(key, lang=None, **kwargs):
     """
@@ -63,9 +67,12 @@ def trans_function(key, lang=None, **kwargs):
     try:
         return trans(key, lang=lang, **kwargs)
     except Exception as e:
-        logger.error(f"Translation error for key '{key}': {str(e)}", exc_info=True)
+        logger.error("Translation error for key '%s': %s", key, e, exc_info=True)
         return key
 
+# Basic email regex pattern, compiled once
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
 def is_valid_email(email):
     """
     Validate email address format.
@@ -79,9 +86,7 @@ def is_valid_email(email):
     if not email or not isinstance(email, str):
         return False
     
-    # Basic email regex pattern
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email.strip()) is not None
+    return _EMAIL_PATTERN.match(email.strip()) is not None
 
 def get_mongo_db():
     """
@@ -104,7 +109,7 @@ def get_mongo_db():
         logger.error("No MongoDB client available")
         return None
     except Exception as e:
-        logger.error(f"Error getting MongoDB connection: {str(e)}", exc_info=True)
+        logger.error("Error getting MongoDB connection: %s", e, exc_info=True)
         return None
 
 def close_mongo_db():
@@ -118,7 +123,7 @@ def close_mongo_db():
                 client.close()
                 logger.info("MongoDB connection closed")
     except Exception as e:
-        logger.error(f"Error closing MongoDB connection: {str(e)}", exc_info=True)
+        logger.error("Error closing MongoDB connection: %s", e, exc_info=True)
 
 def get_limiter(app):
     """
@@ -140,7 +145,7 @@ def get_limiter(app):
         logger.info("Rate limiter initialized")
         return limiter
     except Exception as e:
-        logger.error(f"Error initializing rate limiter: {str(e)}", exc_info=True)
+        logger.error("Error initializing rate limiter: %s", e, exc_info=True)
         # Return a mock limiter that does nothing
         class MockLimiter:
             def limit(self, *args, **kwargs):
@@ -164,7 +169,7 @@ def get_mail(app):
         logger.info("Mail service initialized")
         return mail
     except Exception as e:
-        logger.error(f"Error initializing mail service: {str(e)}", exc_info=True)
+        logger.error("Error initializing mail service: %s", e, exc_info=True)
         return None
 
 def requires_role(role):
@@ -209,17 +214,17 @@ def check_coin_balance(user_id, required_amount=1):
     """
     try:
         db = get_mongo_db()
-        if not db:
+        if db is None:
             return False
         
-        user = db.users.find_one({'_id': user_id})
+        user = db.users.find_one({'_id': user_id}, {'coin_balance': 1})
         if not user:
             return False
         
         coin_balance = user.get('coin_balance', 0)
         return coin_balance >= required_amount
     except Exception as e:
-        logger.error(f"Error checking coin balance for user {user_id}: {str(e)}", exc_info=True)
+        logger.error("Error checking coin balance for user %s: %s", user_id, e, exc_info=True)
         return False
 
 def format_currency(amount, currency='₦', lang=None):
@@ -244,7 +249,7 @@ def format_currency(amount, currency='₦', lang=None):
             return f"{currency}{int(amount):,}"
         return f"{currency}{amount:,.2f}"
     except (TypeError, ValueError) as e:
-        logger.warning(f"Error formatting currency {amount}: {str(e)}")
+        logger.warning("Error formatting currency %s: %s", amount, e)
         return f"{currency}0"
 
 def format_date(date_obj, lang=None, format_type='short'):
@@ -268,12 +273,9 @@ def format_date(date_obj, lang=None, format_type='short'):
         
         if isinstance(date_obj, str):
             try:
-                date_obj = datetime.strptime(date_obj, '%Y-%m-%d')
+                date_obj = datetime.fromisoformat(date_obj.replace('Z', '+00:00'))
             except ValueError:
-                try:
-                    date_obj = datetime.fromisoformat(date_obj.replace('Z', '+00:00'))
-                except ValueError:
-                    return date_obj
+                return date_obj
         
         if format_type == 'iso':
             return date_obj.strftime('%Y-%m-%d')
@@ -288,9 +290,12 @@ def format_date(date_obj, lang=None, format_type='short'):
             else:
                 return date_obj.strftime('%m/%d/%Y')
     except Exception as e:
-        logger.warning(f"Error formatting date {date_obj}: {str(e)}")
+        logger.warning("Error formatting date %s: %s", date_obj, e)
         return str(date_obj) if date_obj else ''
 
+# Deletion table for characters stripped by sanitize_input
+_UNSAFE_CHARS_TABLE = str.maketrans('', '', '<>"\'')
+
 def sanitize_input(input_string, max_length=None):
     """
     Sanitize user input to prevent XSS and other attacks.
@@ -309,7 +314,7 @@ def sanitize_input(input_string, max_length=None):
     sanitized = str(input_string).strip()
     
     # Remove potentially dangerous characters
-    sanitized = re.sub(r'[<>"\']', '', sanitized)
+    sanitized = sanitized.translate(_UNSAFE_CHARS_TABLE)
     
     # Limit length if specified
     if max_length and len(sanitized) > max_length:
@@ -398,12 +403,107 @@ def log_user_action(action, details=None, user_id=None):
             log_entry['user_agent'] = request.headers.get('User-Agent')
         
         db = get_mongo_db()
-        if db:
-            db.audit_logs.insert_one(log_entry)
+        if db is not None:
+            queue_insert(db.audit_logs, log_entry)
         
-        logger.info(f"User action logged: {action} by user {user_id}")
+        logger.info("User action logged: %s by user %s", action, user_id)
     except Exception as e:
-        logger.error(f"Error logging user action: {str(e)}", exc_info=True)
+        logger.error("Error logging user action: %s", e, exc_info=True)
+
+# Background writer for fire-and-forget inserts (audit and usage logs)
+INSERT_BATCH_SIZE = 500
+INSERT_FLUSH_INTERVAL = 2.0
+INSERT_QUEUE_MAXSIZE = 10000
+INSERT_SHUTDOWN_TIMEOUT = 10.0
+_INSERT_STOP = object()
+_insert_queue = queue.Queue(maxsize=INSERT_QUEUE_MAXSIZE)
+_insert_worker = None
+_insert_worker_lock = threading.Lock()
+
+def _flush_inserts(batch):
+    """Insert a batch of queued (collection, document) pairs with one insert_many per collection."""
+    grouped = {}
+    for collection, document in batch:
+        grouped.setdefault(collection.full_name, (collection, []))[1].append(document)
+    for collection, documents in grouped.values():
+        try:
+            collection.insert_many(documents, ordered=False)
+        except Exception as e:
+            logger.error("Error writing %s queued documents to %s: %s", len(documents), collection.full_name, e, exc_info=True)
+
+def _run_insert_worker():
+    """
+    Drain the insert queue, flushing every INSERT_BATCH_SIZE documents or INSERT_FLUSH_INTERVAL seconds.
+    On the stop sentinel, the batch being collected is written before the worker exits.
+    """
+    while True:
+        item = _insert_queue.get()
+        if item is _INSERT_STOP:
+            return
+        batch = [item]
+        stopping = False
+        deadline = time.monotonic() + INSERT_FLUSH_INTERVAL
+        while len(batch) < INSERT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _insert_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _INSERT_STOP:
+                stopping = True
+                break
+            batch.append(item)
+        _flush_inserts(batch)
+        if stopping:
+            return
+
+def queue_insert(collection, document):
+    """
+    Queue a document for insertion by the background writer instead of blocking the request.
+    The queue is bounded; when it is full the document is dropped with a warning.
+    
+    Args:
+        collection: PyMongo collection to insert into
+        document: Document to insert
+    """
+    global _insert_worker
+    if _insert_worker is None or not _insert_worker.is_alive():
+        with _insert_worker_lock:
+            if _insert_worker is None or not _insert_worker.is_alive():
+                _insert_worker = threading.Thread(target=_run_insert_worker, name='ficore-insert-writer', daemon=True)
+                _insert_worker.start()
+    try:
+        _insert_queue.put_nowait((collection, document))
+    except queue.Full:
+        logger.warning("Insert queue full, dropping document for %s", collection.full_name)
+
+def flush_insert_queue():
+    """
+    Stop the background writer and synchronously write everything still pending (e.g. at shutdown).
+    The worker first writes the batch it is holding; anything left in the queue is written here.
+    """
+    worker = _insert_worker
+    if worker is not None and worker.is_alive():
+        try:
+            _insert_queue.put(_INSERT_STOP, timeout=INSERT_SHUTDOWN_TIMEOUT)
+            worker.join(INSERT_SHUTDOWN_TIMEOUT)
+        except queue.Full:
+            logger.warning("Insert queue full, could not signal the background writer to stop")
+        if worker.is_alive():
+            logger.warning("Background writer did not stop within %s seconds", INSERT_SHUTDOWN_TIMEOUT)
+    batch = []
+    while True:
+        try:
+            item = _insert_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is not _INSERT_STOP:
+            batch.append(item)
+    if batch:
+        _flush_inserts(batch)
+        logger.info("Flushed %s queued documents", len(batch))
 
 # Data conversion functions for backward compatibility
 def to_dict_financial_health(record):
@@ -593,6 +693,8 @@ __all__ = [
     'validate_required_fields',
     'get_user_language',
     'log_user_action',
+    'queue_insert',
+    'flush_insert_queue',
     'to_dict_financial_health',
     'to_dict_budget',
     'to_dict_bill',